@@ -18,12 +18,13 @@ Features:
 import os
 import queue
 import sys
+import threading
 import time
 import json
 import uuid
 import torch
 import multiprocessing
-from typing import Dict, List, Union, Optional, Any
+from typing import Dict, List, Tuple, Union, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -282,6 +283,88 @@ class GPUManager:
             )
 
 
+class _ResultRouter:
+    """
+    Routes results from a model's shared result queue to waiting callers.
+
+    One waiting caller at a time reads from the queue and hands each result
+    to the caller registered for it, waking the others through a condition
+    variable. Results that no caller is waiting for are dropped.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._pending: set = set()
+        self._results: Dict[str, Any] = {}
+        self._reading = False
+
+    def register(self, task_id: str) -> None:
+        """
+        Mark a task as awaiting its result.
+
+        Args:
+            task_id: ID of the task
+        """
+        with self._cond:
+            self._pending.add(task_id)
+
+    def unregister(self, task_id: str) -> None:
+        """
+        Stop awaiting a task and drop its result if it was delivered.
+
+        Args:
+            task_id: ID of the task
+        """
+        with self._cond:
+            self._pending.discard(task_id)
+            self._results.pop(task_id, None)
+
+    def wait(
+        self, result_queue: Any, task_id: str, timeout: float
+    ) -> Tuple[bool, Any]:
+        """
+        Wait for the result of a registered task.
+
+        Args:
+            result_queue: Queue the model process posts results to
+            task_id: ID of the task to wait for
+            timeout: Timeout in seconds
+
+        Returns:
+            Tuple of (found, result); result is None if not found
+        """
+        deadline = time.monotonic() + timeout
+        try:
+            while True:
+                with self._cond:
+                    if task_id in self._results:
+                        return True, self._results.pop(task_id)
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False, None
+                    if self._reading:
+                        # Another caller is reading; it will wake us
+                        self._cond.wait(remaining)
+                        continue
+                    self._reading = True
+
+                item = None
+                try:
+                    item = result_queue.get(timeout=remaining)
+                except queue.Empty:
+                    pass
+                finally:
+                    with self._cond:
+                        self._reading = False
+                        if item is not None:
+                            result_task_id, result = item
+                            if result_task_id in self._pending:
+                                self._results[result_task_id] = result
+                        self._cond.notify_all()
+        finally:
+            self.unregister(task_id)
+
+
 class ModelGrid:
     """
     Main class for managing multiple models across available GPUs.
@@ -340,6 +423,8 @@ class ModelGrid:
         )
         self.model_locks: Dict[str, Any] = {}
 
+        self._result_routers: Dict[str, _ResultRouter] = {}
+
         logger.info(
             f"ModelGrid initialized with {len(self.gpu_manager.gpus)} GPUs"
         )
@@ -489,6 +574,8 @@ class ModelGrid:
             if model_name in self.model_locks:
                 del self.model_locks[model_name]
 
+        self._result_routers.pop(model_name, None)
+
         # Remove model metadata
         del self.models[model_name]
 
@@ -1121,26 +1208,23 @@ class ModelGrid:
         task_id = str(uuid.uuid4())
         task_queue = self.task_queues[model_name]
         result_queue = self.result_queues[model_name]
+        router = self._result_routers.setdefault(
+            model_name, _ResultRouter()
+        )
 
-        # Send task to model process
-        task_queue.put((task_id, tasks[0], input_data))
+        # Register before sending so the result is never mistaken for stale
+        router.register(task_id)
 
-        # Wait for result
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            try:
-                # Check if result is available
-                result_task_id, result = result_queue.get(block=False)
-
-                if result_task_id == task_id:
-                    return result
-                else:
-                    # Put back other task results
-                    result_queue.put((result_task_id, result))
+        # Send task to model process
+        try:
+            task_queue.put((task_id, tasks[0], input_data))
+        except Exception:
+            router.unregister(task_id)
+            raise
 
-            except queue.Empty:
-                # No results yet, wait a bit
-                time.sleep(0.1)
+        found, result = router.wait(result_queue, task_id, timeout)
+        if found:
+            return result
 
         # Timeout
         logger.warning(
@@ -1323,7 +1407,7 @@ class PyTorchModelWrapper(ModelWithCustomRunMethod):
                 input_tensor = input_data.to(self.device)
 
             # Run forward pass
-            with torch.no_grad():
+            with torch.inference_mode():
                 output = self.model(input_tensor)
 
             # Convert output to numpy if needed
@@ -1350,7 +1434,7 @@ class PyTorchModelWrapper(ModelWithCustomRunMethod):
                 input_tensor = input_data.to(self.device)
 
             # Run prediction
-            with torch.no_grad():
+            with torch.inference_mode():
                 output = self.model(input_tensor)
 
                 # Apply softmax if output is logits
@@ -1389,15 +1473,18 @@ class HuggingFaceModelWrapper(ModelWithCustomRunMethod):
         # Example implementation for common Hugging Face tasks
         if task == "generate":
             # Generate text
-            return self.model.generate(**input_data)
+            with torch.inference_mode():
+                return self.model.generate(**input_data)
 
         elif task == "encode":
             # Encode text
-            return self.model.encode(input_data)
+            with torch.inference_mode():
+                return self.model.encode(input_data)
 
         elif task == "predict":
             # Make predictions
-            return self.model(**input_data)
+            with torch.inference_mode():
+                return self.model(**input_data)
 
         else:
             raise ValueError(f"Unsupported task: {task}")
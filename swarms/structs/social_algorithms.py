@@ -319,16 +319,17 @@ class SocialAlgorithms:
                 f"Algorithm execution exceeded {self.max_execution_time} seconds"
             )
 
-        # Set up timeout
+        # Set up timeout as a single real-time deadline. Unlike
+        # signal.alarm, setitimer honours fractional seconds.
         old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(int(self.max_execution_time))
+        signal.setitimer(signal.ITIMER_REAL, self.max_execution_time)
 
         try:
             result = func(*args, **kwargs)
             return result
         finally:
-            # Restore original handler
-            signal.alarm(0)
+            # Cancel the timer and restore original handler
+            signal.setitimer(signal.ITIMER_REAL, 0)
             signal.signal(signal.SIGALRM, old_handler)
 
     def _format_output(self, result: Any) -> Any:
@@ -11,6 +11,37 @@ from pydantic import BaseModel
 import requests
 from litellm import completion, supports_vision
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connect/read timeouts for fetching remote media sources
+MEDIA_FETCH_TIMEOUT = (3.05, 10)
+
+_http_session: Optional[requests.Session] = None
+
+
+def _get_http_session() -> requests.Session:
+    """
+    Return a shared requests.Session with a pooled HTTP adapter.
+
+    Reusing one session keeps connections alive across calls, so repeated
+    fetches from the same host skip the TCP and TLS handshakes.
+
+    Returns:
+        requests.Session: The module-level session, created on first use.
+    """
+    global _http_session
+    if _http_session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=2, backoff_factor=0.2),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _http_session = session
+    return _http_session
 
 
 class LiteLLMException(Exception):
@@ -43,7 +74,9 @@ def get_audio_base64(audio_source: str) -> str:
         FileNotFoundError: If the local audio file does not exist.
     """
     if audio_source.startswith(("http://", "https://")):
-        response = requests.get(audio_source)
+        response = _get_http_session().get(
+            audio_source, timeout=MEDIA_FETCH_TIMEOUT
+        )
         response.raise_for_status()
         audio_data = response.content
     else:
@@ -75,7 +108,9 @@ def get_image_base64(image_source: str) -> str:
         return image_source
 
     if image_source.startswith(("http://", "https://")):
-        response = requests.get(image_source)
+        response = _get_http_session().get(
+            image_source, timeout=MEDIA_FETCH_TIMEOUT
+        )
         response.raise_for_status()
         image_data = response.content
     else:
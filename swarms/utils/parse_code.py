@@ -1,5 +1,8 @@
 import re
 
+# Regex pattern to match code blocks and optional language specifiers
+CODE_BLOCK_PATTERN = re.compile(r"```(\w+)?\n(.*?)```", re.DOTALL)
+
 
 def extract_code_blocks_with_language(markdown_text: str):
     """
@@ -13,11 +16,8 @@ def extract_code_blocks_with_language(markdown_text: str):
                     - 'language': The detected language (or 'plaintext' if none specified).
                     - 'content': The content of the code block.
     """
-    # Regex pattern to match code blocks and optional language specifiers
-    pattern = r"```(\w+)?\n(.*?)```"
-
     # Find all matches (language and content)
-    matches = re.findall(pattern, markdown_text, re.DOTALL)
+    matches = CODE_BLOCK_PATTERN.findall(markdown_text)
 
     # Parse results
     code_blocks = []
@@ -0,0 +1,106 @@
+import queue
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("torch")
+
+from swarms.structs.multi_model_gpu_manager import ModelGrid
+
+TIMEOUT_RESULT = {"status": "error", "error": "Timeout"}
+
+
+@pytest.fixture
+def model_grid(tmp_path, monkeypatch):
+    # ModelGrid writes its log file to the working directory
+    monkeypatch.chdir(tmp_path)
+    grid = ModelGrid(use_multiprocessing=False)
+    grid.task_queues["model"] = queue.Queue()
+    grid.result_queues["model"] = queue.Queue()
+    return grid
+
+
+def start_worker(grid, count=1, delay=0.0):
+    """
+    Answer tasks on the model's task queue after an optional delay.
+
+    Tasks sent with input_data "ignore" are never answered. The IDs of
+    answered tasks are appended to the returned list.
+    """
+    answered = []
+
+    def worker():
+        for _ in range(count):
+            task_id, _, input_data = grid.task_queues["model"].get()
+            if input_data == "ignore":
+                continue
+            time.sleep(delay)
+            answered.append(task_id)
+            grid.result_queues["model"].put(
+                (task_id, {"status": "success", "task_id": task_id})
+            )
+
+    threading.Thread(target=worker, daemon=True).start()
+    return answered
+
+
+def test_run_in_process_returns_own_result(model_grid):
+    answered = start_worker(model_grid)
+    result = model_grid._run_in_process(
+        "model", ["run_model"], None, timeout=2
+    )
+    assert result == {"status": "success", "task_id": answered[0]}
+
+
+def test_run_in_process_skips_stale_result(model_grid):
+    model_grid.result_queues["model"].put(
+        ("stale-task", {"status": "success", "result": "x" * 100_000})
+    )
+
+    answered = start_worker(model_grid, delay=0.2)
+    result = model_grid._run_in_process(
+        "model", ["run_model"], None, timeout=2
+    )
+
+    assert result == {"status": "success", "task_id": answered[0]}
+
+
+def test_run_in_process_ignores_late_result_after_timeout(model_grid):
+    answered = start_worker(model_grid, count=2, delay=0.3)
+
+    result = model_grid._run_in_process(
+        "model", ["run_model"], None, timeout=0.05
+    )
+    assert result == TIMEOUT_RESULT
+
+    result = model_grid._run_in_process(
+        "model", ["run_model"], None, timeout=2
+    )
+    assert result == {"status": "success", "task_id": answered[1]}
+
+
+def test_run_in_process_concurrent_callers(model_grid):
+    answered = start_worker(model_grid, count=2)
+    results = {}
+
+    def slow_caller():
+        results["slow"] = model_grid._run_in_process(
+            "model", ["run_model"], "ignore", timeout=3
+        )
+
+    slow = threading.Thread(target=slow_caller)
+    slow.start()
+    # Let the slow caller start waiting on the result queue first
+    time.sleep(0.1)
+
+    start = time.monotonic()
+    fast = model_grid._run_in_process(
+        "model", ["run_model"], None, timeout=1
+    )
+    elapsed = time.monotonic() - start
+    slow.join()
+
+    assert fast == {"status": "success", "task_id": answered[0]}
+    assert elapsed < 0.5
+    assert results["slow"] == TIMEOUT_RESULT